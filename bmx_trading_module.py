@@ -1,29 +1,124 @@
 import os
 from web3 import Web3
-import random
 import logging
 import asyncio
-import aiohttp
 import json
+import re
 import time
-from decimal import Decimal, getcontext
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 import traceback
 import sys
 import threading
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 TRADING_LOCK = False
 # Trading state management
 TRADE_IN_PROGRESS = False
 TRADE_LOCK = threading.Lock()
-ACTIVE_TRADES = {}  # symbol -> bool  
+ACTIVE_TRADES = {}  # symbol -> True while a trade is running; removed on release
 ACTIVE_TRADES_LOCK = threading.Lock()
+PENDING_TRADES = set()  # Futures of queued trades still running on the async loop
+PENDING_TRADES_DONE = threading.Condition(ACTIVE_TRADES_LOCK)  # Notified as each one finishes
 
 # Flask and web framework imports
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
 import requests
 
+# Fast JSON encoding (optional - falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_pretty(obj) -> str:
+    """Pretty-print a payload for the logs, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so plain dict returns skip stdlib json"""
+
+    def dumps(self, obj, **kwargs):
+        # Flask asks for compact separators on every response; any other
+        # option (e.g. indent when app.json.compact is off) goes to stdlib
+        if set(kwargs) <= {'separators'} and kwargs.get('separators', (',', ':')) == (',', ':'):
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+            try:
+                # orjson encodes datetimes natively (ISO 8601); Flask's default
+                # hook only covers what orjson can't, e.g. Decimal
+                return orjson.dumps(obj, option=option, default=self.default).decode()
+            except orjson.JSONEncodeError:
+                pass  # e.g. ints past 64 bits (raw wei/uint256 values)
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class LazyJson:
+    """Log argument that pretty-prints its payload only if the record is emitted"""
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self):
+        return dumps_pretty(self.obj)
+
+# Faster event loop for the async trade path (optional - falls back to asyncio)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Environment and configuration
+from dotenv import load_dotenv
+
+# Load environment variables before any module-level os.getenv() below
+load_dotenv()
+
+# Configure logging with enhanced formatting
+_LOG_HANDLERS = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('trading_bot.log') if os.path.exists('.') else logging.StreamHandler(sys.stdout)
+]
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+for _handler in _LOG_HANDLERS:
+    _handler.setFormatter(_log_formatter)
+
+# Request threads only enqueue records; a listener thread does the stdout
+# and file writes so a slow log pipe never stalls a webhook
+_LOG_QUEUE_HANDLER = QueueHandler(queue.SimpleQueue())
+_LOG_LISTENER = None
+
+def _start_log_listener():
+    """Start the log writer thread (again in each forked gunicorn worker)"""
+    global _LOG_LISTENER
+    log_queue = queue.SimpleQueue()
+    _LOG_QUEUE_HANDLER.queue = log_queue
+    _LOG_LISTENER = QueueListener(log_queue, *_LOG_HANDLERS, respect_handler_level=True)
+    _LOG_LISTENER.start()
+
+def _stop_log_listener():
+    """Flush queued records on interpreter exit"""
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(_LOG_QUEUE_HANDLER)
+_start_log_listener()
+os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(_stop_log_listener)
+
+logger = logging.getLogger('bmx_trading_module')
+
 # ============================================================================
 # 🎯 BMX PROTOCOL CONSTANTS - UPDATED FOR LIVE EXECUTION
 # ============================================================================
@@ -31,6 +126,8 @@ import requests
 # USDC Contract on Base Network (6 decimals - CRITICAL FIX)
 USDC_CONTRACT = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"  # ✅ CORRECT
 USDC_DECIMALS = 6  # ✅ CRITICAL: USDC uses 6 decimals, not 18!
+USDC_UNIT = 10 ** USDC_DECIMALS  # Raw units per 1 USDC
+BASESCAN_TX_URL = "https://basescan.org/tx/"
 
 # === SYMMIO MODE & ADDRESSES ===
 EXECUTION_MODE = os.getenv("EXECUTION_MODE", "SYMMIO")
@@ -190,83 +287,132 @@ BMX_VAULT_ABI = [
 # 🌐 LIVE PRICE FETCHING - PRESERVED FROM ORIGINAL
 # ============================================================================
 
+# Shared HTTP session so price lookups reuse one pooled TLS connection
+# instead of opening a new one on every trade
+http_session = requests.Session()
+
+# Circuit breaker for the price API: a short timeout per call, and after
+# repeated failures skip the lookup for a cooldown so a CoinGecko outage
+# doesn't add a stalled request to every trade (signal price is used instead)
+LIVE_PRICE_TIMEOUT_SECONDS = 3
+LIVE_PRICE_MAX_FAILURES = 3
+LIVE_PRICE_COOLDOWN_SECONDS = 60
+_live_price_failures = 0
+_live_price_skip_until = 0.0
+
+# Map symbols to CoinGecko IDs
+COINGECKO_IDS = {
+    'BTC/USDT': 'bitcoin',
+    'BTC/USD': 'bitcoin', 
+    'BTCUSD': 'bitcoin',
+    'BTC': 'bitcoin',
+    'ETH/USDT': 'ethereum',
+    'ETH/USD': 'ethereum',
+    'ETHUSD': 'ethereum', 
+    'ETH': 'ethereum',
+    'SOL/USDT': 'solana',
+    'SOL/USD': 'solana',
+    'SOLUSD': 'solana',
+    'SOL': 'solana',
+    'AVAX/USDT': 'avalanche-2',
+    'AVAX/USD': 'avalanche-2',
+    'AVAXUSD': 'avalanche-2',
+    'AVAX': 'avalanche-2',
+    'LINK/USDT': 'chainlink',
+    'LINK/USD': 'chainlink',
+    'LINKUSD': 'chainlink',
+    'LINK': 'chainlink'
+}
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+
 def get_live_price(symbol):
     """Get live price from CoinGecko API"""
+    global _live_price_failures, _live_price_skip_until
+
+    if time.monotonic() < _live_price_skip_until:
+        logger.warning("⚠️ Live price lookup skipped - CoinGecko circuit open")
+        return None
+
     try:
-        # Map symbols to CoinGecko IDs
-        symbol_map = {
-            'BTC/USDT': 'bitcoin',
-            'BTC/USD': 'bitcoin', 
-            'BTCUSD': 'bitcoin',
-            'BTC': 'bitcoin',
-            'ETH/USDT': 'ethereum',
-            'ETH/USD': 'ethereum',
-            'ETHUSD': 'ethereum', 
-            'ETH': 'ethereum',
-            'SOL/USDT': 'solana',
-            'SOL/USD': 'solana',
-            'SOLUSD': 'solana',
-            'SOL': 'solana',
-            'AVAX/USDT': 'avalanche-2',
-            'AVAX/USD': 'avalanche-2',
-            'AVAXUSD': 'avalanche-2',
-            'AVAX': 'avalanche-2',
-            'LINK/USDT': 'chainlink',
-            'LINK/USD': 'chainlink',
-            'LINKUSD': 'chainlink',
-            'LINK': 'chainlink'
-        }
+        coingecko_id = COINGECKO_IDS.get(symbol, 'bitcoin')  # Default to bitcoin
         
-        coingecko_id = symbol_map.get(symbol, 'bitcoin')  # Default to bitcoin
-        
-        url = "https://api.coingecko.com/api/v3/simple/price"
         params = {"ids": coingecko_id, "vs_currencies": "usd"}
         
-        response = requests.get(url, params=params, timeout=10)
+        response = http_session.get(COINGECKO_PRICE_URL, params=params, timeout=LIVE_PRICE_TIMEOUT_SECONDS)
         response.raise_for_status()
         
         data = response.json()
         live_price = data[coingecko_id]["usd"]
         
-        logger.info(f"🌐 LIVE PRICE from CoinGecko: ${live_price:.2f}")
+        _live_price_failures = 0
+        logger.info("🌐 LIVE PRICE from CoinGecko: $%.2f", live_price)
         return live_price
         
     except Exception as e:
-        logger.error(f"❌ Failed to get live price: {e}")
+        logger.error("❌ Failed to get live price: %s", e)
+        _live_price_failures += 1
+        if _live_price_failures >= LIVE_PRICE_MAX_FAILURES:
+            _live_price_failures = 0
+            _live_price_skip_until = time.monotonic() + LIVE_PRICE_COOLDOWN_SECONDS
+            logger.warning("⚠️ CoinGecko failing - skipping live prices for %ss", LIVE_PRICE_COOLDOWN_SECONDS)
         return None
 
 # Web3 and blockchain imports
-from web3 import Web3
-from web3.exceptions import Web3Exception, ContractLogicError
-import eth_account
+from web3.exceptions import ContractLogicError
 from eth_account import Account
 
-# Environment and configuration
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+# The HTTP provider retries transient RPC errors itself - web3 v7+ takes a
+# retry configuration, v6 a retry middleware; both are sized from TradingConfig
+try:
+    from web3.providers.rpc.utils import ExceptionRetryConfiguration
+except ImportError:
+    ExceptionRetryConfiguration = None
+    from web3.middleware.exception_retry_request import check_if_retry_on_failure
 
 # Environment Configuration
 RPC_URL = os.getenv('BASE_RPC_URL')
-print(f"🌐 Using RPC: {RPC_URL}")
 CHAIN_ID = int(os.getenv('CHAIN_ID', 8453))
 PRIVATE_KEY = os.getenv('PRIVATE_KEY')
 
-# Configure logging with enhanced formatting
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('trading_bot.log') if os.path.exists('.') else logging.StreamHandler(sys.stdout)
-    ]
-)
-
-logger = logging.getLogger('bmx_trading_module')
+# Hosted RPC URLs embed the API key in the path/query - log the host only
+logger.info("🌐 Using RPC host: %s", urlsplit(RPC_URL).hostname if RPC_URL else None)
 
 # Flask application setup
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)  # Route dict returns and request.get_json()
+
+# ============================================================================
+# ⚡ PERSISTENT ASYNC LOOP - SHARED BY ALL REQUEST HANDLERS
+# ============================================================================
+
+# asyncio.run() builds and tears down a fresh event loop on every request.
+# Keep one loop alive in a daemon thread and submit coroutines to it instead.
+# The loop is created lazily so it is started inside each gunicorn worker
+# rather than in a pre-fork master (threads do not survive fork).
+_ASYNC_LOOP = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
+def _get_async_loop():
+    """Return the persistent event loop, starting it on first use"""
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            _ASYNC_LOOP = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            threading.Thread(
+                target=_ASYNC_LOOP.run_forever,
+                name='bmx-async-loop',
+                daemon=True
+            ).start()
+        return _ASYNC_LOOP
+
+def submit_async(coro):
+    """Schedule a coroutine on the persistent loop and return its future"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop())
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the persistent loop and block until it finishes"""
+    return submit_async(coro).result(timeout=timeout)
 
 # ============================================================================
 # 🔧 CONFIGURATION AND CONSTANTS - ENHANCED FOR BMX LIVE EXECUTION
@@ -276,9 +422,9 @@ class TradingConfig:
     """Centralized configuration for the BMX trading bot"""
    
     # 🌐 Network Configuration
-    RPC_URL = os.getenv('BASE_RPC_URL')
-    CHAIN_ID = int(os.getenv('CHAIN_ID', 8453))  # Base network
-    PRIVATE_KEY = os.getenv('PRIVATE_KEY')
+    RPC_URL = RPC_URL
+    CHAIN_ID = CHAIN_ID  # Base network
+    PRIVATE_KEY = PRIVATE_KEY
 
     # 🎯 Dynamic Position Sizing Configuration (PRESERVED FROM ORIGINAL)
     TIER_POSITION_PERCENTAGES = {
@@ -304,6 +450,12 @@ class TradingConfig:
     MIN_MARGIN_REQUIRED = 25  # Minimum margin in USDC
     GAS_LIMIT = 25000  # Higher for BMX complexity
     GAS_PRICE_GWEI = 2
+    RPC_RETRY_ATTEMPTS = 3  # Provider attempts per read-only RPC call on transient errors
+    RPC_RETRY_BASE_DELAY = 0.5  # Provider backoff in seconds, doubled per retry
+    BALANCE_CACHE_TTL = 10  # Seconds a USDC balance read is reused
+    CONNECTION_CHECK_TTL = 5  # Seconds an RPC connectivity probe is reused
+    MAX_WEBHOOK_BODY = 16 * 1024  # Signals are a few hundred bytes
+    RECEIPT_TIMEOUT = 8  # Seconds per receipt wait - a trade's three must fit gunicorn's 30s graceful_timeout
     EXECUTION_FEE = MIN_EXECUTION_FEE  # For keeper execution
 
     # 🎯 Position Sizing Configuration (PRESERVED)
@@ -319,10 +471,76 @@ class TradingConfig:
     LOG_TRADE_PARAMETERS = True
     LOG_BALANCE_CHECKS = True
 
+# Werkzeug enforces the cap while reading the stream, so chunked bodies
+# with no Content-Length can't slip past the webhook's header check
+app.config['MAX_CONTENT_LENGTH'] = TradingConfig.MAX_WEBHOOK_BODY
+
+# 🎯 Flattened tier -> (account percentage, minimum position) lookup
+TIER_SIZING = {
+    tier: (percentage, TradingConfig.MIN_TIER_POSITIONS[tier])
+    for tier, percentage in TradingConfig.TIER_POSITION_PERCENTAGES.items()
+}
+
+# 📊 Slippage factors in basis points, fixed for the life of the process
+SLIPPAGE_BPS = int(TradingConfig.DEFAULT_SLIPPAGE * 10000)  # 0.8% = 80 basis points
+LONG_PRICE_BPS = 10000 + SLIPPAGE_BPS
+SHORT_PRICE_BPS = 10000 - SLIPPAGE_BPS
+POSITION_BUFFER = 1.05  # Only 5% buffer for BMX (no price impact)
+
+# 🔍 Known crypto tickers for the unsupported-symbol fallback (single C-level scan)
+KNOWN_CRYPTO_RE = re.compile(r'BTC|ETH|SOL|LINK|AVAX')
+
+# 💰 Entry price field names, checked in order, per signal format
+SHEETS_PRICE_FIELDS = (
+    'entry_price', 'entryPrice', 'entry', 'Entry',
+    'price', 'Price', 'open_price', 'openPrice',
+    'signal_price', 'signalPrice'
+)
+TRADE_PRICE_FIELDS = ('entry_price', 'entry', 'price', 'open_price', 'entryPrice', 'openPrice')
+GENERIC_PRICE_FIELDS = (
+    'entry_price', 'entry', 'price', 'trigger_price',
+    'signal_price', 'target_price', 'open_price'
+)
+
+# ✅ Accepted trade directions (O(1) membership on the validation path)
+VALID_DIRECTIONS = frozenset(('LONG', 'SHORT'))
+
+# ✅ Fields a processed signal must carry (non-empty), checked in this order
+REQUIRED_SIGNAL_FIELDS = ('symbol', 'direction', 'entry_price', 'position_size')
+
 # ============================================================================
 # 🌐 WEB3 AND BLOCKCHAIN UTILITIES - ENHANCED FOR BMX LIVE EXECUTION
 # ============================================================================
 
+def _rpc_retry_middleware(make_request, w3):
+    """web3 v6 counterpart of v7's ExceptionRetryConfiguration"""
+    def middleware(method, params):
+        if not check_if_retry_on_failure(method):
+            return make_request(method, params)
+        for attempt in range(TradingConfig.RPC_RETRY_ATTEMPTS):
+            try:
+                return make_request(method, params)
+            except (requests.ConnectionError, requests.HTTPError, requests.Timeout):
+                if attempt == TradingConfig.RPC_RETRY_ATTEMPTS - 1:
+                    raise
+                time.sleep(TradingConfig.RPC_RETRY_BASE_DELAY * 2 ** attempt)
+    return middleware
+
+def _build_rpc_provider(session=None):
+    """HTTP provider for the Base RPC, retrying dropped connections, timeouts and 429/5xx"""
+    if ExceptionRetryConfiguration is not None:
+        return Web3.HTTPProvider(
+            TradingConfig.RPC_URL,
+            session=session,
+            exception_retry_configuration=ExceptionRetryConfiguration(
+                retries=TradingConfig.RPC_RETRY_ATTEMPTS,
+                backoff_factor=TradingConfig.RPC_RETRY_BASE_DELAY
+            )
+        )
+    provider = Web3.HTTPProvider(TradingConfig.RPC_URL, session=session)
+    provider.middlewares = (_rpc_retry_middleware,)  # Replaces v6's fixed 5-try retry
+    return provider
+
 class Web3Manager:
     """Manages Web3 connections and blockchain interactions for BMX"""
     def __init__(self):
@@ -333,13 +551,19 @@ class Web3Manager:
         self.usdc_contract = None
         self.bmx_token = None
         self.wblt_token = None
+        self._usdc_balance_cache = {}  # address -> (monotonic read time, balance)
+        self._usdc_balance_lock = threading.Lock()
+        self._usdc_balance_inflight = {}  # address -> Future of the RPC read in progress
+        self._usdc_balance_generation = 0  # Bumped by invalidate_usdc_balance()
+        self._connected_cache = (None, False)  # (monotonic probe time, connected)
         self._initialize_web3()
 
     def _initialize_web3(self):
         """Initialize Web3 connection and BMX contracts"""
         try:
-            # Initialize Web3
-            self.w3 = Web3(Web3.HTTPProvider(TradingConfig.RPC_URL))
+            # Initialize Web3. The provider caches a keep-alive requests session
+            # per thread, so request threads and the trade loop each reuse theirs
+            self.w3 = Web3(_build_rpc_provider())
 
             if not self.w3.is_connected():
                 logger.error("❌ Failed to connect to Base network")
@@ -350,15 +574,15 @@ class Web3Manager:
             # Initialize account
             if TradingConfig.PRIVATE_KEY:
                 try:
-                    logger.info(f"🔍 PRIVATE_KEY length: {len(TradingConfig.PRIVATE_KEY)}")
+                    logger.info("🔍 PRIVATE_KEY length: %s", len(TradingConfig.PRIVATE_KEY))
                     self.account = Account.from_key(TradingConfig.PRIVATE_KEY)
-                    logger.info(f"✅ Account loaded: {self.account.address}")
+                    logger.info("✅ Account loaded: %s", self.account.address)
                 except Exception as account_error:
-                    logger.error(f"❌ Account creation failed: {account_error}")
+                    logger.error("❌ Account creation failed: %s", account_error)
                     self.account = None
             else:
                 logger.warning("⚠️ No private key provided - read-only mode")
-                logger.warning(f"🔍 PRIVATE_KEY exists: {bool(TradingConfig.PRIVATE_KEY)}")
+                logger.warning("🔍 PRIVATE_KEY exists: %s", bool(TradingConfig.PRIVATE_KEY))
                 self.account = None
                 
             # Initialize contracts
@@ -368,7 +592,7 @@ class Web3Manager:
 
         except ContractLogicError as e:
             error_msg = str(e)
-            logger.error(f"🚨 CONTRACT LOGIC ERROR: {error_msg}")
+            logger.error("🚨 CONTRACT LOGIC ERROR: %s", error_msg)
             
             # Specific error analysis
             if "VAULT_INSUFFICIENT_RESERVE" in error_msg:
@@ -380,7 +604,7 @@ class Web3Manager:
             elif "INSUFFICIENT_COLLATERAL" in error_msg:
                 logger.error("💡 FIX: Not enough USDC balance or approval")
             else:
-                logger.error(f"💡 UNKNOWN CONTRACT ERROR: {error_msg}")
+                logger.error("💡 UNKNOWN CONTRACT ERROR: %s", error_msg)
                 
             return {
                 "status": "contract_error",
@@ -394,7 +618,7 @@ class Web3Manager:
             }
             
         except Exception as e:
-            logger.error(f"❌ Web3 initialization failed: {str(e)}")
+            logger.error("❌ Web3 initialization failed: %s", e)
             return False
 
     def _initialize_bmx_contracts(self):
@@ -442,23 +666,82 @@ class Web3Manager:
             logger.info("✅ BMX smart contracts initialized with live execution support")
 
         except Exception as e:
-            logger.error(f"❌ BMX contract initialization failed: {str(e)}")
-
-    def get_usdc_balance(self, address: str) -> float:
-        """Get USDC balance for an address - FIXED for 6 decimals"""
+            logger.error("❌ BMX contract initialization failed: %s", e)
+
+    def reset_connections(self):
+        """Swap in a fresh provider so no RPC socket is shared with the gunicorn master"""
+        if self.w3:
+            # A session handed to the provider replaces the one web3 cached for
+            # this thread - the master's, inherited across fork
+            self.w3.provider = _build_rpc_provider(session=requests.Session())
+        self._connected_cache = (None, False)
+
+    def get_usdc_balance(self, address: str, strict: bool = False, use_cache: bool = True) -> float:
+        """Get USDC balance for an address - FIXED for 6 decimals
+
+        With strict=True a failed read raises instead of reporting 0.0, for
+        callers that size positions from the result. use_cache=False skips
+        the TTL cache (the fresh value is still cached for other callers).
+        Concurrent reads of one address share a single RPC.
+        """
         try:
             if not self.usdc_contract:
+                if strict:
+                    raise Exception("USDC contract not initialized")
                 return 0.0
 
-            balance_wei = self.usdc_contract.functions.balanceOf(address).call()
-            balance_usdc = balance_wei / (10 ** USDC_DECIMALS)  # ✅ FIXED: Use 6 decimals
-
+            with self._usdc_balance_lock:
+                # Balance only moves when we trade - reuse a recent read
+                if use_cache:
+                    cached = self._usdc_balance_cache.get(address)
+                    if cached and time.monotonic() - cached[0] < TradingConfig.BALANCE_CACHE_TTL:
+                        return cached[1]
+
+                # Join a read already in flight (started since the last
+                # invalidation), else become the one thread that issues the RPC
+                pending = self._usdc_balance_inflight.get(address)
+                owns_read = pending is None
+                if owns_read:
+                    pending = Future()
+                    self._usdc_balance_inflight[address] = pending
+                    generation = self._usdc_balance_generation
+
+            if not owns_read:
+                return pending.result()
+
+            # RPC outside the lock so cache hits for other callers don't wait on it
+            try:
+                balance_wei = self.usdc_contract.functions.balanceOf(address).call()
+                balance_usdc = balance_wei / USDC_UNIT  # ✅ FIXED: Use 6 decimals
+            except Exception as e:
+                with self._usdc_balance_lock:
+                    if self._usdc_balance_inflight.get(address) is pending:
+                        del self._usdc_balance_inflight[address]
+                pending.set_exception(e)
+                raise
+
+            with self._usdc_balance_lock:
+                if self._usdc_balance_inflight.get(address) is pending:
+                    del self._usdc_balance_inflight[address]
+                # A trade invalidated the cache mid-read - don't store a pre-trade balance
+                if generation == self._usdc_balance_generation:
+                    self._usdc_balance_cache[address] = (time.monotonic(), balance_usdc)
+            pending.set_result(balance_usdc)
             return balance_usdc
 
         except Exception as e:
-            logger.error(f"❌ Balance check failed: {str(e)}")
+            logger.error("❌ Balance check failed: %s", e)
+            if strict:
+                raise
             return 0.0
 
+    def invalidate_usdc_balance(self):
+        """Drop cached USDC balances after a trade moves funds"""
+        with self._usdc_balance_lock:
+            self._usdc_balance_cache.clear()
+            self._usdc_balance_inflight.clear()  # Later reads must not join a pre-trade RPC
+            self._usdc_balance_generation += 1
+
     def get_bmx_balance(self, address: str) -> float:
         """Get BMX token balance for an address"""
         try:
@@ -471,7 +754,7 @@ class Web3Manager:
             return balance_bmx
 
         except Exception as e:
-            logger.error(f"❌ BMX balance check failed: {str(e)}")
+            logger.error("❌ BMX balance check failed: %s", e)
             return 0.0
 
     def get_wblt_balance(self, address: str) -> float:
@@ -486,25 +769,41 @@ class Web3Manager:
             return balance_wblt
 
         except Exception as e:
-            logger.error(f"❌ wBLT balance check failed: {str(e)}")
+            logger.error("❌ wBLT balance check failed: %s", e)
             return 0.0
 
     def is_connected(self) -> bool:
         """Check if Web3 is connected"""
-        return self.w3 and self.w3.is_connected()
+        if not self.w3:
+            return False
+
+        # Health checks poll this - reuse a recent probe instead of an RPC per request
+        checked_at, connected = self._connected_cache
+        now = time.monotonic()
+        if checked_at is None or now - checked_at >= TradingConfig.CONNECTION_CHECK_TTL:
+            connected = self.w3.is_connected()
+            self._connected_cache = (now, connected)
+        return connected
 
 # Initialize global Web3 manager
 try:
     web3_manager = Web3Manager()
     logger.info("✅ Web3Manager created successfully")
 except Exception as web3_error:
-    logger.error(f"❌ Web3Manager creation failed: {web3_error}")
+    logger.error("❌ Web3Manager creation failed: %s", web3_error)
     web3_manager = None
 
 # ============================================================================
 # 📊 GOOGLE SHEETS INTEGRATION - PRESERVED FROM ORIGINAL
 # ============================================================================
 
+def _first(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """Value of the first key present in data (same as nested .get() fallbacks, evaluated lazily)"""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
 class GoogleSheetsManager:
     """Manages Google Sheets integration for signal processing"""
 
@@ -517,9 +816,9 @@ class GoogleSheetsManager:
             logger.info("📊 Processing Google Sheets signal for BMX...")
 
             # Extract signal information with multiple field name attempts
-            symbol = trade_data.get('symbol', trade_data.get('Symbol', ''))
-            direction = trade_data.get('direction', trade_data.get('Direction', ''))
-            tier = trade_data.get('tier', trade_data.get('Tier', 1))
+            symbol = _first(trade_data, 'symbol', 'Symbol', default='')
+            direction = _first(trade_data, 'direction', 'Direction', default='')
+            tier = _first(trade_data, 'tier', 'Tier', default=1)
 
             # Extract entry price with multiple field attempts
             entry_price = self._extract_entry_price(trade_data)
@@ -528,9 +827,9 @@ class GoogleSheetsManager:
             position_size = self._calculate_position_size(tier)
 
             # Extract additional parameters
-            leverage = trade_data.get('leverage', trade_data.get('Leverage', TradingConfig.DEFAULT_LEVERAGE))
-            stop_loss = trade_data.get('stop_loss', trade_data.get('stopLoss', 0))
-            take_profit = trade_data.get('take_profit', trade_data.get('takeProfit', 0))
+            leverage = _first(trade_data, 'leverage', 'Leverage', default=TradingConfig.DEFAULT_LEVERAGE)
+            stop_loss = _first(trade_data, 'stop_loss', 'stopLoss', default=0)
+            take_profit = _first(trade_data, 'take_profit', 'takeProfit', default=0)
 
             processed_signal = {
                 'symbol': symbol,
@@ -546,28 +845,22 @@ class GoogleSheetsManager:
                 'signal_quality': trade_data.get('quality', 85)
             }
 
-            logger.info(f"✅ Processed BMX signal: {symbol} {direction} ${position_size} @ ${entry_price}")
+            logger.info("✅ Processed BMX signal: %s %s $%s @ $%s", symbol, direction, position_size, entry_price)
 
             return processed_signal
 
         except Exception as e:
-            logger.error(f"❌ Google Sheets processing failed: {str(e)}")
+            logger.error("❌ Google Sheets processing failed: %s", e)
             return {}
 
     def _extract_entry_price(self, trade_data: Dict[str, Any]) -> float:
         """Extract entry price from signal data with multiple field attempts"""
-        price_fields = [
-            'entry_price', 'entryPrice', 'entry', 'Entry',
-            'price', 'Price', 'open_price', 'openPrice',
-            'signal_price', 'signalPrice'
-        ]
-
-        for field in price_fields:
+        for field in SHEETS_PRICE_FIELDS:
             if field in trade_data and trade_data[field]:
                 try:
                     price = float(trade_data[field])
                     if price > 0:
-                        logger.info(f"💰 Found entry price in field '{field}': ${price}")
+                        logger.info("💰 Found entry price in field '%s': $%s", field, price)
                         return price
                 except (ValueError, TypeError):
                     continue
@@ -618,10 +911,15 @@ class BMXTrader:
     
             self.wallet_address = self.web3_manager.account.address 
 
-            logging.info(f"📝 Wallet Address: {self.wallet_address}")
-            logging.info(f"📝 USDC Contract: {USDC_CONTRACT}")
-            logging.info(f"📝 BMX Token: {BMX_TOKEN_CONTRACT}")
-            logging.info(f"📝 wBLT Token: {WBLT_TOKEN_CONTRACT}")
+            # Chain ID is fixed for the RPC endpoint - fetch once at startup
+            # so the first trade doesn't pay for the round trip
+            self.chain_id = self.w3.eth.chain_id
+            logger.info("📝 Chain ID: %s", self.chain_id)
+
+            logger.info("📝 Wallet Address: %s", self.wallet_address)
+            logger.info("📝 USDC Contract: %s", USDC_CONTRACT)
+            logger.info("📝 BMX Token: %s", BMX_TOKEN_CONTRACT)
+            logger.info("📝 wBLT Token: %s", WBLT_TOKEN_CONTRACT)
         
             # Create contract instances
             self.usdc_contract = self.w3.eth.contract(
@@ -629,14 +927,13 @@ class BMXTrader:
                 abi=USDC_ABI
             )
 
-            # BMX Position Router contract (CRITICAL for keeper execution)
-            self.bmx_position_router = self.w3.eth.contract(
+            # BMX Position Router and Vault are the same contracts Web3Manager
+            # already built - share them rather than constructing them twice
+            self.bmx_position_router = self.web3_manager.bmx_position_router or self.w3.eth.contract(
                 address=BMX_POSITION_ROUTER,
                 abi=BMX_POSITION_ROUTER_ABI
-            ) 
-
-            # BMX Vault contract for oracle pricing
-            self.bmx_vault = self.w3.eth.contract(
+            )
+            self.bmx_vault = self.web3_manager.bmx_vault or self.w3.eth.contract(
                 address=BMX_VAULT_CONTRACT,
                 abi=BMX_VAULT_ABI
             )
@@ -653,10 +950,10 @@ class BMXTrader:
                 abi=BMX_POSITION_ROUTER_ABI  # same ABI covers addAccount & depositAndAllocateForAccount
             )
 
-            logging.info("✅ BMX contracts initialized for live keeper execution!")
+            logger.info("✅ BMX contracts initialized for live keeper execution!")
         
         except Exception as e:
-            logging.error(f"❌ BMX contract initialization failed: {e}")
+            logger.error("❌ BMX contract initialization failed: %s", e)
             raise Exception(f"BMX contract initialization failed: {e}")
 
     def _initialize_supported_tokens(self) -> Dict[str, Dict]:
@@ -699,68 +996,65 @@ class BMXTrader:
         # Clean up symbol format
         clean_symbol = symbol.replace('/USDT', '').replace('/USD', '').replace('USD', '').upper()
 
-        logger.info(f"🔍 Converting symbol: {symbol} -> {clean_symbol}")
+        logger.info("🔍 Converting symbol: %s -> %s", symbol, clean_symbol)
         available = list(self.supported_tokens.keys())
-        logger.info(f"📋 Available tokens: {available}")
+        logger.info("📋 Available tokens: %s", available)
         
         if clean_symbol in self.supported_tokens:
-            logger.info(f"✅ Symbol {symbol} → {clean_symbol} (supported)")
+            logger.info("✅ Symbol %s → %s (supported)", symbol, clean_symbol)
             return clean_symbol
         
         # 🔧 SAFETY: Default to BTC only if it's a reasonable crypto symbol
-        crypto_symbols = ['BTC', 'ETH', 'SOL', 'LINK', 'AVAX']
-        if any(crypto in symbol.upper() for crypto in crypto_symbols):
-            logger.warning(f"⚠️ Symbol {symbol} not found, defaulting to BTC")
+        if KNOWN_CRYPTO_RE.search(symbol.upper()):
+            logger.warning("⚠️ Symbol %s not found, defaulting to BTC", symbol)
             return 'BTC'
         
         # If it's not a crypto symbol, reject it
-        logger.error(f"❌ Symbol {symbol} not supported and not a known crypto")
+        logger.error("❌ Symbol %s not supported and not a known crypto", symbol)
         return None
 
     def get_oracle_price(self, token_address: str, is_long: bool) -> int:
         """Skip BMX oracle - use entry price directly"""
-        logger.info(f"🔮 Using entry price directly (oracle bypass)")
+        logger.info("🔮 Using entry price directly (oracle bypass)")
         return 0  # This triggers your existing entry price fallback
     
     def calculate_acceptable_price(self, oracle_price: int, is_long: bool) -> int:
         """Calculate acceptable price with proper slippage for BMX keeper execution"""
         try:
-            slippage_basis_points = int(TradingConfig.DEFAULT_SLIPPAGE * 10000)  # 0.8% = 80 basis points
-            
             if is_long:
                 # For longs: acceptable price is maximum we're willing to pay
                 # Add slippage to current price
-                acceptable_price = oracle_price * (10000 + slippage_basis_points) // 10000
+                acceptable_price = oracle_price * LONG_PRICE_BPS // 10000
             else:
                 # For shorts: acceptable price is minimum we're willing to receive
                 # Subtract slippage from current price
-                acceptable_price = oracle_price * (10000 - slippage_basis_points) // 10000
+                acceptable_price = oracle_price * SHORT_PRICE_BPS // 10000
             
-            logger.info(f"📊 Acceptable price calculated: ${acceptable_price / 1e30:.2f} ({'LONG' if is_long else 'SHORT'})")
+            logger.info("📊 Acceptable price calculated: $%.2f (%s)", acceptable_price / 1e30, 'LONG' if is_long else 'SHORT')
             return acceptable_price
 
         except Exception as e:
-            logger.error(f"❌ Failed to calculate acceptable price: {e}")
+            logger.error("❌ Failed to calculate acceptable price: %s", e)
             return oracle_price  # Fallback to oracle price
 
     async def monitor_execution(self, tx_hash: str, timeout_seconds: int = 300) -> Dict[str, Any]:
         """Monitor keeper execution by checking USDC balance"""
         try:
-            logger.info(f"👀 Monitoring execution for TX: {tx_hash}")
+            logger.info("👀 Monitoring execution for TX: %s", tx_hash)
         
             # Get transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+            receipt = await asyncio.to_thread(self.w3.eth.wait_for_transaction_receipt, tx_hash, timeout=60)
             if receipt.status != 1:
                 return {"success": False, "error": "Transaction failed on-chain"}
         
             # Simple approach: Check if USDC balance decreased
-            trader_address = self.web3_manager.account.address
-            balance_before = self.usdc_contract.functions.balanceOf(trader_address).call()
+            trader_address = self.wallet_address
+            balance_before = await asyncio.to_thread(self.usdc_contract.functions.balanceOf(trader_address).call)
         
             # Wait a bit for keeper execution, then check again
             await asyncio.sleep(30)  # Wait 30 seconds for keeper
         
-            balance_after = self.usdc_contract.functions.balanceOf(trader_address).call()
+            balance_after = await asyncio.to_thread(self.usdc_contract.functions.balanceOf(trader_address).call)
         
             if balance_after < balance_before:
                 logger.info("✅ USDC balance decreased - position executed!")
@@ -770,44 +1064,37 @@ class BMXTrader:
                 return {"success": False, "error": "No USDC deduction detected"}
             
         except Exception as e:
-            logger.error(f"❌ Execution monitoring failed: {e}")
+            logger.error("❌ Execution monitoring failed: %s", e)
             return {"success": False, "error": f"Monitoring failed: {str(e)}"}
 
     async def execute_trade(self, trade_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute trade on BMX protocol with enhanced keeper execution"""
         try:
-            logger.info(f"🎯 EXECUTING BMX TRADE:")
-            logger.info(f"🚀 ELITE BMX TRADING BOT v300 - Processing trade request")
-            logger.info(f"🎯 BMX KEEPER EXECUTION - Superior reliability!")
+            logger.info("🎯 EXECUTING BMX TRADE: ELITE BMX TRADING BOT v300 - BMX KEEPER EXECUTION")
 
             # Network verification
-            chain_id = self.w3.eth.chain_id  
-            logger.info(f"🔗 NETWORK CHECK: Connected to Chain ID: {chain_id}")
+            chain_id = self.chain_id
             if chain_id != 8453:
-                logger.error(f"❌ WRONG NETWORK! You're on chain {chain_id}, not Base!")
+                logger.error("❌ WRONG NETWORK! You're on chain %s, not Base!", chain_id)
                 return {'status': 'error', 'error': f'Wrong network: {chain_id}'}
-            else:
-                logger.info(f"✅ CORRECT NETWORK: Base mainnet confirmed!")
+            logger.info("✅ NETWORK CHECK: Base mainnet confirmed (Chain ID: %s)", chain_id)
 
             # Enhanced debugging for entry price detection
-            logger.info(f"🔍 DEBUGGING entry price detection:")
-            logger.info(f"  Full trade_data keys: {list(trade_data.keys())}")
+            logger.info("🔍 DEBUGGING entry price detection - trade_data keys: %s", list(trade_data))
 
             # Extract entry price with multiple field name attempts
             entry_price_dollars = None
             entry_price_source = None
 
-            price_fields = ['entry_price', 'entry', 'price', 'open_price', 'entryPrice', 'openPrice']
-
-            for field in price_fields:
+            for field in TRADE_PRICE_FIELDS:
                 if field in trade_data and trade_data[field] and trade_data[field] != 0:
                     entry_price_dollars = float(trade_data[field])
                     entry_price_source = field
-                    logger.info(f"💰 Found valid entry price in field '{field}': ${entry_price_dollars}")
+                    logger.info("💰 Found valid entry price in field '%s': $%s", field, entry_price_dollars)
                     break
 
             if entry_price_dollars is None or entry_price_dollars == 0:
-                logger.error(f"❌ No valid entry price found in any field!")
+                logger.error("❌ No valid entry price found in any field!")
                 return {
                     'status': 'error',
                     'error': 'No valid entry price found',
@@ -819,62 +1106,75 @@ class BMXTrader:
             direction = trade_data.get('direction', 'LONG').upper()
             leverage = int(trade_data.get('leverage', TradingConfig.DEFAULT_LEVERAGE))
 
-            # Get supported symbol for BMX
+            # Get supported symbol for BMX - reject before any balance/price RPC
             symbol = self.get_supported_symbol(symbol)
-            logger.info(f"🎯 Trading symbol: {symbol} -> BMX: {symbol}")
+            if symbol is None:
+                return {
+                    'status': 'error',
+                    'error': f"Unsupported symbol: {trade_data.get('symbol')}"
+                }
+            logger.info("🎯 Trading symbol: %s -> BMX: %s", symbol, symbol)
 
             # 🚀 DYNAMIC POSITION SIZING (PRESERVED FROM ORIGINAL)
-            trader_address = self.web3_manager.account.address
+            trader_address = self.wallet_address
             
-            if trader_address:
-                try:
-                    current_balance = self.web3_manager.get_usdc_balance(trader_address)
-                    logger.info(f"✅ Current Balance: ${current_balance:.2f} USDC")
-                except Exception as e:
-                    logger.error(f"❌ Failed to read balance: {e}")
-                    current_balance = 250  # Fallback
-            else:
-                current_balance = 250
+            # No balance, no trade - sizing from a guessed or cached balance could
+            # over-commit. Read the chain fresh, off the event loop
+            try:
+                current_balance = await asyncio.to_thread(
+                    self.web3_manager.get_usdc_balance, trader_address, strict=True, use_cache=False
+                )
+                logger.info("✅ Current Balance: $%.2f USDC", current_balance)
+            except Exception as e:
+                logger.error("❌ Failed to read balance: %s", e)
+                return {
+                    'status': 'error',
+                    'error': f'Could not read USDC balance for position sizing: {e}'
+                }
 
             # Calculate position size based on account balance and tier
             tier = int(trade_data.get('tier', 2))
 
-            if tier in TradingConfig.TIER_POSITION_PERCENTAGES:
-                percentage = TradingConfig.TIER_POSITION_PERCENTAGES[tier]
+            tier_sizing = TIER_SIZING.get(tier)
+            if tier_sizing:
+                percentage, min_position = tier_sizing
                 calculated_position = current_balance * percentage
-                min_position = TradingConfig.MIN_TIER_POSITIONS[tier]
                 position_usdc_dollars = max(calculated_position, min_position)
 
-                logger.info(f"💰 DYNAMIC POSITION SIZING - BMX ELITE:")
-                logger.info(f"  - Current Balance: ${current_balance:.2f} USDC")
-                logger.info(f"  - Tier {tier}: {percentage*100:.0f}% of account")
-                logger.info(f"  - Final Position: ${position_usdc_dollars:.2f} USDC")
+                logger.info(
+                    "💰 DYNAMIC POSITION SIZING - BMX ELITE:\n"
+                    "  - Current Balance: $%.2f USDC\n"
+                    "  - Tier %s: %.0f%% of account\n"
+                    "  - Final Position: $%.2f USDC",
+                    current_balance, tier, percentage*100, position_usdc_dollars
+                )
             else:
                 position_usdc_dollars = float(trade_data.get('position_size', 150))
 
             # BMX advantage: No price impact, so less slippage protection needed
-            slippage_adjustment = 1.05  # Only 5% buffer for BMX
             original_position = position_usdc_dollars
-            position_usdc_dollars = position_usdc_dollars * slippage_adjustment
+            position_usdc_dollars = position_usdc_dollars * POSITION_BUFFER
 
-            logger.info(f"💡 BMX ADVANTAGE - MINIMAL SLIPPAGE:")
-            logger.info(f"   - No price impact trading on BMX!")
-            logger.info(f"   - Original position: ${original_position:.2f}")
-            logger.info(f"   - With 5% buffer: ${position_usdc_dollars:.2f}")
+            logger.info(
+                "💡 BMX ADVANTAGE - MINIMAL SLIPPAGE (no price impact trading on BMX!):\n"
+                "   - Original position: $%.2f\n"
+                "   - With 5%% buffer: $%.2f",
+                original_position, position_usdc_dollars
+            )
 
             # Price validation
-            live_price = get_live_price(symbol)
+            live_price = await asyncio.to_thread(get_live_price, symbol)
             if live_price:
                 price_diff = abs(live_price - entry_price_dollars) / entry_price_dollars * 100
                 if price_diff > 2.0:
-                    logger.warning(f"⚠️ Price difference {price_diff:.2f}% detected")
+                    logger.warning("⚠️ Price difference %.2f%% detected", price_diff)
                     entry_price_dollars = live_price
                     entry_price_source = "Live API (CoinGecko)"
 
             # 🔧 SAFETY: Check minimum position requirements
             min_position_usd = 50  # BMX minimum position size
             if position_usdc_dollars < min_position_usd:
-                logger.error(f"❌ Position ${position_usdc_dollars:.2f} below minimum ${min_position_usd}")
+                logger.error("❌ Position $%.2f below minimum $%s", position_usdc_dollars, min_position_usd)
                 return {
                     "status": "error",
                     "error": f"Position size ${position_usdc_dollars:.2f} below minimum ${min_position_usd}"
@@ -883,15 +1183,18 @@ class BMXTrader:
             # 🔧 SAFETY: Check margin requirements  
             required_margin = position_usdc_dollars / leverage
             if required_margin < TradingConfig.MIN_MARGIN_REQUIRED:
-                logger.error(f"❌ Margin ${required_margin:.2f} below minimum ${TradingConfig.MIN_MARGIN_REQUIRED}")
+                logger.error("❌ Margin $%.2f below minimum $%s", required_margin, TradingConfig.MIN_MARGIN_REQUIRED)
                 return {
                     "status": "error", 
                     "error": f"Margin ${required_margin:.2f} below minimum ${TradingConfig.MIN_MARGIN_REQUIRED}"
                 }
                 
-            logger.info(f"✅ SAFETY CHECKS PASSED:")
-            logger.info(f"   - Position: ${position_usdc_dollars:.2f} (min: ${min_position_usd})")
-            logger.info(f"   - Margin: ${required_margin:.2f} (min: ${TradingConfig.MIN_MARGIN_REQUIRED})")
+            logger.info(
+                "✅ SAFETY CHECKS PASSED:\n"
+                "   - Position: $%.2f (min: $%s)\n"
+                "   - Margin: $%.2f (min: $%s)",
+                position_usdc_dollars, min_position_usd, required_margin, TradingConfig.MIN_MARGIN_REQUIRED
+            )
 
             # Execute the BMX trade with keeper execution
             result = await self._execute_bmx_trade_keeper(
@@ -904,17 +1207,25 @@ class BMXTrader:
                 trade_data=trade_data
             )
 
+            # Approve/deposit may have moved USDC even if a later step failed
+            self.web3_manager.invalidate_usdc_balance()
+
             return result
 
         except Exception as e:
-            logger.error(f"❌ BMX trade execution failed: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ BMX trade execution failed: %s", e)
             return {
                 'status': 'error',
                 'error': f'BMX trade execution failed: {str(e)}',
                 'traceback': traceback.format_exc()
             }
 
+    def _send_contract_tx(self, contract_call, trader_address, gas_limit=None):
+        """Build, sign and broadcast a contract call - blocking, run it via asyncio.to_thread"""
+        txn = contract_call.build_transaction(_tx_args(self.w3, trader_address, gas_limit=gas_limit))
+        signed = self.w3.eth.account.sign_transaction(txn, TradingConfig.PRIVATE_KEY)
+        return self.w3.eth.send_raw_transaction(signed.rawTransaction)
+
     async def _execute_bmx_trade_keeper(
             self,
             trader_address: str,
@@ -928,52 +1239,64 @@ class BMXTrader:
         """Execute BMX trade using SYMMIO protocol"""
         
         try:
-            logger.info(f"🎯 Preparing SYMMIO execution...")
+            logger.info("🎯 Preparing SYMMIO execution...")
             
             # Step 1: Create sub-account if needed
             logger.info("👤 Creating SYMMIO sub-account...")
             try:
                 # -- SYMMIO: create (or reuse) a sub-account on MultiAccount
-                account_txn = self.symmio_multi.functions.addAccount(
-                    f"BMXBot_{int(time.time())}"
-                ).build_transaction(_tx_args(self.w3, trader_address))
-
-                signed_account = self.w3.eth.account.sign_transaction(account_txn, TradingConfig.PRIVATE_KEY)
-                account_hash = self.w3.eth.send_raw_transaction(signed_account.rawTransaction)
-                logger.info(f"✅ Sub-account tx sent: {account_hash.hex()}")
-                self.w3.eth.wait_for_transaction_receipt(account_hash)
+                # Gas/nonce lookups, the broadcast and receipt polling all block on
+                # the RPC - run them in a worker thread so the shared event loop
+                # stays free for other coroutines
+                account_hash = await asyncio.to_thread(
+                    self._send_contract_tx,
+                    self.symmio_multi.functions.addAccount(f"BMXBot_{int(time.time())}"),
+                    trader_address
+                )
+                logger.info("✅ Sub-account tx sent: %s", account_hash.hex())
+                await asyncio.to_thread(
+                    self.w3.eth.wait_for_transaction_receipt, account_hash, timeout=TradingConfig.RECEIPT_TIMEOUT
+                )
 
             except Exception as e:
-                logger.warning(f"⚠️ Sub-account creation failed (may already exist): {e}")
+                logger.warning("⚠️ Sub-account creation failed (may already exist): %s", e)
             
 
             # ---- Step 2: APPROVE USDC (spender = SYMMIO MultiAccount)
-            position_usdc = int(position_usdc_dollars * (10 ** USDC_DECIMALS))
-
-            approve_txn = self.usdc_contract.functions.approve(
-                SYMMIO_USDC_SPENDER,           # <- MultiAccount address
-                position_usdc * 2              # approve a bit extra
-            ).build_transaction(_tx_args(self.w3, trader_address, gas_limit=60000))
-
-            signed_approve = self.w3.eth.account.sign_transaction(approve_txn, TradingConfig.PRIVATE_KEY)
-            approve_hash = self.w3.eth.send_raw_transaction(signed_approve.rawTransaction)
-            logger.info(f"✅ USDC approve tx: {approve_hash.hex()}")
-            self.w3.eth.wait_for_transaction_receipt(approve_hash)
+            position_usdc = int(position_usdc_dollars * USDC_UNIT)
+
+            approve_hash = await asyncio.to_thread(
+                self._send_contract_tx,
+                self.usdc_contract.functions.approve(
+                    SYMMIO_USDC_SPENDER,           # <- MultiAccount address
+                    position_usdc * 2              # approve a bit extra
+                ),
+                trader_address,
+                60000
+            )
+            logger.info("✅ USDC approve tx: %s", approve_hash.hex())
+            await asyncio.to_thread(
+                self.w3.eth.wait_for_transaction_receipt, approve_hash, timeout=TradingConfig.RECEIPT_TIMEOUT
+            )
 
             # ---- Step 3: DEPOSIT & ALLOCATE
-            logger.info(f"💰 Depositing ${position_usdc_dollars:.2f} USDC to SYMMIO...")
-            deposit_txn = self.symmio_multi.functions.depositAndAllocateForAccount(
+            logger.info("💰 Depositing $%.2f USDC to SYMMIO...", position_usdc_dollars)
+            deposit_hash = await asyncio.to_thread(
+                self._send_contract_tx,
+                self.symmio_multi.functions.depositAndAllocateForAccount(
+                    trader_address,
+                    position_usdc
+                ),
                 trader_address,
-                position_usdc
-            ).build_transaction(_tx_args(self.w3, trader_address, gas_limit=180000))
-
-            signed_deposit = self.w3.eth.account.sign_transaction(deposit_txn, TradingConfig.PRIVATE_KEY)
-            deposit_hash = self.w3.eth.send_raw_transaction(signed_deposit.rawTransaction)
-            logger.info(f"✅ Deposit tx: {deposit_hash.hex()}")
-            self.w3.eth.wait_for_transaction_receipt(deposit_hash)
+                180000
+            )
+            logger.info("✅ Deposit tx: %s", deposit_hash.hex())
+            await asyncio.to_thread(
+                self.w3.eth.wait_for_transaction_receipt, deposit_hash, timeout=TradingConfig.RECEIPT_TIMEOUT
+            )
 
             # Step 4: Send trading quote (intent)
-            logger.info(f"📝 Sending trading quote...")
+            logger.info("📝 Sending trading quote...")
 
             # Don't send quote yet - return debug info
             return {
@@ -1022,16 +1345,16 @@ class BMXTrader:
             })
             
             signed_quote = self.w3.eth.account.sign_transaction(quote_txn, TradingConfig.PRIVATE_KEY)
-            quote_hash = self.w3.eth.send_raw_transaction(signed_quote.rawTransaction)
+            quote_hash = self.w3.eth.send_raw_transaction(signed_quote.rawTransaction).hex()
             
-            logger.info(f"🚀 QUOTE SUBMITTED: {quote_hash.hex()}")
-            logger.info(f"🔗 BaseScan: https://basescan.org/tx/{quote_hash.hex()}")
+            logger.info("🚀 QUOTE SUBMITTED: %s", quote_hash)
+            logger.info("🔗 BaseScan: %s%s", BASESCAN_TX_URL, quote_hash)
             
             return {
                 "status": "success",
                 "message": "SYMMIO quote submitted - waiting for hedger to fill",
-                "tx_hash": quote_hash.hex(),
-                "basescan_url": f"https://basescan.org/tx/{quote_hash.hex()}",
+                "tx_hash": quote_hash,
+                "basescan_url": BASESCAN_TX_URL + quote_hash,
                 "trade_details": {
                     "symbol": symbol,
                     "position_size": f"${position_usdc_dollars:.2f}",
@@ -1048,7 +1371,7 @@ class BMXTrader:
             }
             
         except Exception as e:
-            logger.error(f"❌ SYMMIO execution failed: {str(e)}")
+            logger.error("❌ SYMMIO execution failed: %s", e)
             return {
                 "status": "error",
                 "message": f"SYMMIO execution failed: {str(e)}"
@@ -1057,9 +1380,9 @@ class BMXTrader:
 # Initialize BMX trader
 try:
     bmx_trader = BMXTrader()
-    print(f"✅ BMXTrader initialized - has execute_trade: {hasattr(bmx_trader, 'execute_trade')}")
+    logger.info("✅ BMXTrader initialized")
 except Exception as e:
-    print(f"❌ BMXTrader failed to initialize: {e}")
+    logger.error("❌ BMXTrader failed to initialize: %s", e)
     bmx_trader = None
 
 # ============================================================================
@@ -1072,6 +1395,8 @@ class SignalProcessor:
     def __init__(self):
         self.sheets_manager = sheets_manager
         self.trader = bmx_trader
+        # Resolve the trade entry point once; None if BMXTrader failed to initialize
+        self._execute_trade = getattr(self.trader, 'execute_trade', None)
 
     async def process_signal(self, trade_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process incoming trading signal for BMX keeper trading"""
@@ -1100,16 +1425,15 @@ class SignalProcessor:
                 }
 
             # Debug: Check if trader has execute_trade method
-            if not hasattr(self.trader, 'execute_trade'):
-                logger.error(f"❌ BMXTrader missing execute_trade method!")
-                logger.error(f"❌ Available methods: {[m for m in dir(self.trader) if not m.startswith('_')]}")
+            if self._execute_trade is None:
+                logger.error("❌ BMXTrader missing execute_trade method - check startup logs for the init failure")
                 return {
                     'status': 'error',
                     'error': 'BMXTrader not properly initialized - missing execute_trade method'
                 }
 
             # Execute the BMX trade with keeper execution
-            trade_result = await self.trader.execute_trade(processed_signal)
+            trade_result = await self._execute_trade(processed_signal)
 
             return {
                 'status': 'success' if trade_result.get('status') in ['success'] else 'failed',
@@ -1118,7 +1442,7 @@ class SignalProcessor:
             }
 
         except Exception as e:
-            logger.error(f"❌ Signal processing failed: {str(e)}")
+            logger.error("❌ Signal processing failed: %s", e)
             return {
                 'status': 'error',
                 'error': f'Signal processing failed: {str(e)}'
@@ -1127,21 +1451,23 @@ class SignalProcessor:
     def _process_generic_signal(self, trade_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process generic signal format for BMX"""
         if not trade_data:
-            logging.error("❌ No signal data received.")
+            logger.error("❌ No signal data received.")
             return None
 
         try:
             # Extract core signal components
-            symbol = trade_data.get('symbol', trade_data.get('pair', 'BTC/USD'))
-            direction = trade_data.get('direction', trade_data.get('side', 'LONG')).upper()
+            symbol = _first(trade_data, 'symbol', 'pair', default='BTC/USD')
+            direction = _first(trade_data, 'direction', 'side', default='LONG').upper()
 
             # Extract entry price
             entry_price = self._extract_entry_price_generic(trade_data)
 
             # Extract position parameters
-            tier = trade_data.get('tier', trade_data.get('size_tier', 1))
-            position_size = trade_data.get('position_size',
-                                          TradingConfig.POSITION_SIZES.get(tier, TradingConfig.DEFAULT_POSITION_SIZE))
+            tier = _first(trade_data, 'tier', 'size_tier', default=1)
+            if 'position_size' in trade_data:
+                position_size = trade_data['position_size']
+            else:
+                position_size = TradingConfig.POSITION_SIZES.get(tier, TradingConfig.DEFAULT_POSITION_SIZE)
 
             leverage = trade_data.get('leverage', TradingConfig.DEFAULT_LEVERAGE)
 
@@ -1154,21 +1480,16 @@ class SignalProcessor:
                 'leverage': leverage,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'source': 'Generic Signal',
-                'signal_quality': trade_data.get('quality', trade_data.get('confidence', 80))
+                'signal_quality': _first(trade_data, 'quality', 'confidence', default=80)
             }
 
         except Exception as e:
-            logger.error(f"❌ Generic signal processing failed: {str(e)}")
+            logger.error("❌ Generic signal processing failed: %s", e)
             return {}
 
     def _extract_entry_price_generic(self, trade_data: Dict[str, Any]) -> float:
         """Extract entry price from generic signal format"""
-        price_fields = [
-            'entry_price', 'entry', 'price', 'trigger_price',
-            'signal_price', 'target_price', 'open_price'
-        ]
-
-        for field in price_fields:
+        for field in GENERIC_PRICE_FIELDS:
             if field in trade_data:
                 try:
                     price = float(trade_data[field])
@@ -1183,9 +1504,8 @@ class SignalProcessor:
         """Validate processed signal before BMX keeper execution"""
 
         # Check required fields
-        required_fields = ['symbol', 'direction', 'entry_price', 'position_size']
-        for field in required_fields:
-            if field not in signal or not signal[field]:
+        for field in REQUIRED_SIGNAL_FIELDS:
+            if not signal.get(field):
                 return {
                     'valid': False,
                     'reason': f'Missing required field: {field}'
@@ -1199,7 +1519,7 @@ class SignalProcessor:
             }
 
         # Validate direction
-        if signal['direction'] not in ['LONG', 'SHORT']:
+        if signal['direction'] not in VALID_DIRECTIONS:
             return {
                 'valid': False,
                 'reason': 'Direction must be LONG or SHORT'
@@ -1229,67 +1549,161 @@ signal_processor = SignalProcessor()
 # 🌐 WEBHOOK ENDPOINTS AND API ROUTES - ENHANCED FOR BMX KEEPER EXECUTION
 # ============================================================================
 
+# Static part of the health check response, built once at import.
+# Handlers copy it and only fill in the per-request fields - never mutate it.
+HEALTH_CHECK_TEMPLATE = {
+    'status': '🚀 FULLY OPERATIONAL',
+    'service': 'Elite BMX Trading Bot',
+    'version': 'v300-BMX-KEEPER-LIVE',
+    'protocol': 'BMX.trade on Base with Keeper Execution',
+    'contracts': {
+        'position_router': BMX_POSITION_ROUTER,
+        'vault': BMX_VAULT_CONTRACT,
+        'bmx_token': BMX_TOKEN_CONTRACT,
+        'wblt_token': WBLT_TOKEN_CONTRACT
+    },
+    'features': {
+        'google_sheets': True,
+        'bmx_keeper_trading': True,
+        'oracle_pricing': True,
+        'execution_monitoring': True,
+        'dynamic_position_sizing': True,
+        'enhanced_debugging': True,
+        'up_to_50x_leverage': True,
+        'live_execution': True
+    },
+    'improvements': [
+        '🎯 Keeper-based execution system',
+        '🔮 Oracle price validation', 
+        '💰 Fixed USDC decimal handling',
+        '👀 Execution monitoring',
+        '🚀 Enhanced reliability'
+    ]
+}
+
 @app.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint for BMX bot"""
+    response = HEALTH_CHECK_TEMPLATE.copy()
+    response['timestamp'] = datetime.now(timezone.utc).isoformat()
+    response['web3_connected'] = web3_manager.is_connected()
+    return response
+
+def _finish_queued_trade(symbol, future, started):
+    """Log a queued trade's outcome and release its trade slot and symbol"""
+    global TRADE_IN_PROGRESS
+    try:
+        result = future.result()
+        logger.info("🏁 %s trade finished in %.1fs: %s", symbol, time.monotonic() - started, LazyJson(result))
+        status = result.get('status') if isinstance(result, dict) else result
+    except Exception as e:
+        logger.error("❌ Signal processing error: %s", e)
+        status = 'error'
+    finally:
+        # Always unlock the symbol after the attempt (success OR failure)
+        with ACTIVE_TRADES_LOCK:
+            ACTIVE_TRADES.pop(symbol, None)
+        with TRADE_LOCK:
+            TRADE_IN_PROGRESS = False
+    logger.info("🔓 %s marked as INACTIVE after trade attempt (%s)", symbol, status)
+    with PENDING_TRADES_DONE:
+        PENDING_TRADES.discard(future)
+        PENDING_TRADES_DONE.notify_all()
+
+def wait_for_pending_trades(timeout):
+    """Block until queued trades finish, up to timeout seconds - for worker shutdown"""
+    with PENDING_TRADES_DONE:
+        if PENDING_TRADES:
+            logger.info("⏳ Waiting up to %ss for %d queued trade(s) to finish...", timeout, len(PENDING_TRADES))
+        finished = PENDING_TRADES_DONE.wait_for(lambda: not PENDING_TRADES, timeout=timeout)
+        if not finished:
+            logger.error("❌ %d trade(s) still running at shutdown - check the chain for a partial execution", len(PENDING_TRADES))
+        return finished
+
+def _queue_trade(symbol, trade_data):
+    """Mark symbol active and queue its trade on the async loop
+
+    The caller must hold the TRADE_IN_PROGRESS slot. Returns (body, status);
+    on 202 the slot and symbol are released by _finish_queued_trade, on any
+    other status the caller still owns the slot.
+    """
+    # Check if ANY trade is active (only one trade at a time for keeper execution)
+    with ACTIVE_TRADES_LOCK:
+        # Only active symbols are kept, so any entry means a trade is running
+        if ACTIVE_TRADES:
+            active_symbol = next(iter(ACTIVE_TRADES))
+            logger.warning("🚫 Trade REJECTED - Trade already active for %s!", active_symbol)
+            return {'status': 'rejected', 'reason': f'Trade already active for {active_symbol}'}, 400
+
+        # Mark this symbol as active
+        ACTIVE_TRADES[symbol] = True
+        logger.info("✅ %s marked as ACTIVE for BMX keeper trading", symbol)
+
+    # Queue the trade on the async loop and answer right away; the
+    # trade slot and symbol lock are released when the trade finishes
+    try:
+        started = time.monotonic()
+        future = submit_async(signal_processor.process_signal(trade_data))
+    except Exception as process_error:
+        logger.error("❌ Signal processing error: %s", process_error)
+        with ACTIVE_TRADES_LOCK:
+            ACTIVE_TRADES.pop(symbol, None)
+            logger.info("🔓 %s marked as INACTIVE after error", symbol)
+        return {
+            "status": "error",
+            "error": f"Processing failed: {str(process_error)}"
+        }, 500
+
+    with PENDING_TRADES_DONE:
+        PENDING_TRADES.add(future)
+    future.add_done_callback(lambda f: _finish_queued_trade(symbol, f, started))
+
     return {
-        'status': '🚀 FULLY OPERATIONAL',
-        'service': 'Elite BMX Trading Bot',
-        'version': 'v300-BMX-KEEPER-LIVE',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
-        'web3_connected': web3_manager.is_connected(),
-        'protocol': 'BMX.trade on Base with Keeper Execution',
-        'contracts': {
-            'position_router': BMX_POSITION_ROUTER,
-            'vault': BMX_VAULT_CONTRACT,
-            'bmx_token': BMX_TOKEN_CONTRACT,
-            'wblt_token': WBLT_TOKEN_CONTRACT
-        },
-        'features': {
-            'google_sheets': True,
-            'bmx_keeper_trading': True,
-            'oracle_pricing': True,
-            'execution_monitoring': True,
-            'dynamic_position_sizing': True,
-            'enhanced_debugging': True,
-            'up_to_50x_leverage': True,
-            'live_execution': True
-        },
-        'improvements': [
-            '🎯 Keeper-based execution system',
-            '🔮 Oracle price validation', 
-            '💰 Fixed USDC decimal handling',
-            '👀 Execution monitoring',
-            '🚀 Enhanced reliability'
-        ]
-    }
+        "status": "queued",
+        "symbol": symbol,
+        "message": "Trade queued for BMX keeper execution. Check logs for the result."
+    }, 202
 
 @app.route('/webhook', methods=['POST'])
 def webhook():
     """Enhanced webhook endpoint for BMX keeper trading signals"""
-    
+    global TRADE_IN_PROGRESS
+    owns_trade_slot = False  # Only the request that set the flag may clear it
+
     try:
-        trade_data = request.get_json()
-        if not trade_data:
-            logger.error("❌ Empty request body")
-            return {'error': 'Empty request body'}, 400
+        # Cheap rejections first - headers only, the body is not read yet
+        if request.content_length and request.content_length > TradingConfig.MAX_WEBHOOK_BODY:
+            logger.error("❌ Request body too large: %s bytes", request.content_length)
+            return {'error': 'Request body too large'}, 413
 
-        # Version tracking - BMX Keeper Live
-        logger.info(f"🚀 ELITE BMX TRADING BOT v300-KEEPER-LIVE - Processing webhook request")
-        logger.info(f"🎯 BMX KEEPER EXECUTION - EXECUTING REAL TRADES!")
+        if not request.is_json:
+            logger.error("❌ Request is not JSON")
+            return {'error': 'Request must be JSON'}, 400
 
         # Trade protection (preserved from original)
-        global TRADE_IN_PROGRESS
         with TRADE_LOCK:
             if TRADE_IN_PROGRESS:
                 logger.warning("🚫 TRADE REJECTED - Another trade in progress!")
                 return {'status': 'rejected'}, 429
             TRADE_IN_PROGRESS = True
+            owns_trade_slot = True
 
         # Parse incoming request
-        if not request.is_json:
-            logger.error("❌ Request is not JSON")
-            return {'error': 'Request must be JSON'}, 400
+        try:
+            trade_data = request.get_json(silent=True)
+        except RequestEntityTooLarge:
+            logger.error("❌ Request body too large (over %s bytes)", TradingConfig.MAX_WEBHOOK_BODY)
+            return {'error': 'Request body too large'}, 413
+        if trade_data is None:
+            logger.error("❌ Invalid JSON body")
+            return {'error': 'Invalid JSON body'}, 400
+        if not trade_data:
+            logger.error("❌ Empty request body")
+            return {'error': 'Empty request body'}, 400
+
+        # Version tracking - BMX Keeper Live
+        logger.info("🚀 ELITE BMX TRADING BOT v300-KEEPER-LIVE - Processing webhook request")
+        logger.info("🎯 BMX KEEPER EXECUTION - EXECUTING REAL TRADES!")
 
         # Symbol checking and duplicate protection
         symbol = trade_data.get('symbol', '').upper()
@@ -1297,53 +1711,23 @@ def webhook():
             logger.error("❌ No symbol in signal!")
             return {'error': 'Missing symbol in signal'}, 400
 
-        # Check if ANY trade is active (only one trade at a time for keeper execution)
-        with ACTIVE_TRADES_LOCK:
-            active_symbols = [s for s, active in ACTIVE_TRADES.items() if active]
-            if active_symbols:
-                logger.warning(f"🚫 Trade REJECTED - Trade already active for {active_symbols[0]}!")
-                return {'status': 'rejected', 'reason': f'Trade already active for {active_symbols[0]}'}, 400
-
-            # Mark this symbol as active
-            ACTIVE_TRADES[symbol] = True
-            logger.info(f"✅ {symbol} marked as ACTIVE for BMX keeper trading")
+        logger.info("📨 Received BMX signal data: %s", LazyJson(trade_data))
 
-        logger.info(f"📨 Received BMX signal data: {json.dumps(trade_data, indent=2)}")
-
-        # Execute signal processing synchronously for better error handling
-        try:
-            result = asyncio.run(signal_processor.process_signal(trade_data))
-            
-            # Always unlock the symbol after the attempt (success OR failure)
-            with ACTIVE_TRADES_LOCK:
-                ACTIVE_TRADES[symbol] = False
-                logger.info(f"🔓 {symbol} marked as INACTIVE after trade attempt ({result.get('status')})")
-
-            return {
-                "status": "completed",
-                "result": result,
-                "message": "Trade execution completed. Check result for details."
-            }, 200
-            
-        except Exception as process_error:
-            logger.error(f"❌ Signal processing error: {process_error}")
-            with ACTIVE_TRADES_LOCK:
-                ACTIVE_TRADES[symbol] = False
-                logger.info(f"🔓 {symbol} marked as INACTIVE after error")
-            return {
-                "status": "error",
-                "error": f"Processing failed: {str(process_error)}"
-            }, 500
+        response, status = _queue_trade(symbol, trade_data)
+        if status == 202:
+            owns_trade_slot = False  # Handed over to _finish_queued_trade
+        return response, status
 
     except Exception as e:
-        logger.error(f"❌ BMX webhook error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ BMX webhook error: %s", e)
         return {
             'status': 'error',
             'error': f'BMX webhook processing failed: {str(e)}'
         }, 500
-    finally:  
-        TRADE_IN_PROGRESS = False  # Always reset
+    finally:
+        if owns_trade_slot:
+            with TRADE_LOCK:
+                TRADE_IN_PROGRESS = False
 
 @app.route('/balance', methods=['GET'])
 def get_balance():
@@ -1369,13 +1753,25 @@ def get_balance():
         }
 
     except Exception as e:
-        logger.error(f"❌ Balance check failed: {str(e)}")
+        logger.error("❌ Balance check failed: %s", e)
         return {'error': f'Balance check failed: {str(e)}'}, 500
 
 @app.route('/test-trade', methods=['POST'])
 def test_trade():
     """Test BMX keeper trade endpoint with SMALL position for safety"""
+    global TRADE_IN_PROGRESS
+    owns_trade_slot = False
+
     try:
+        # Same single-trade slot and queue as /webhook - a test trade must not
+        # interleave with a live one on the shared loop (nonce reuse)
+        with TRADE_LOCK:
+            if TRADE_IN_PROGRESS:
+                logger.warning("🚫 TEST TRADE REJECTED - Another trade in progress!")
+                return {'status': 'rejected'}, 429
+            TRADE_IN_PROGRESS = True
+            owns_trade_slot = True
+
         test_signal = {
             'symbol': 'BTC/USD',
             'direction': 'LONG',
@@ -1386,58 +1782,67 @@ def test_trade():
             'source': 'BMX Keeper Test - SMALL POSITION'
         }
 
-        logger.info(f"🧪 Testing BMX keeper trade with SMALL signal: {test_signal}")
-        logger.info(f"💡 Using $50 position for safe testing")
-
-        result = asyncio.run(signal_processor.process_signal(test_signal))
+        logger.info("🧪 Testing BMX keeper trade with SMALL signal: %s", test_signal)
+        logger.info("💡 Using $50 position for safe testing")
 
-        return result
+        response, status = _queue_trade(test_signal['symbol'], test_signal)
+        if status == 202:
+            owns_trade_slot = False  # Handed over to _finish_queued_trade
+        return response, status
 
     except Exception as e:
-        logger.error(f"❌ BMX test trade failed: {str(e)}")
+        logger.error("❌ BMX test trade failed: %s", e)
         return {
             'status': 'error',
             'error': f'BMX test trade failed: {str(e)}'
         }, 500
+    finally:
+        if owns_trade_slot:
+            with TRADE_LOCK:
+                TRADE_IN_PROGRESS = False
+
+# Everything in /config is fixed at import - build and encode it once
+CONFIG_PAYLOAD = {
+    'position_sizes': TradingConfig.POSITION_SIZES,
+    'tier_percentages': TradingConfig.TIER_POSITION_PERCENTAGES,
+    'default_leverage': TradingConfig.DEFAULT_LEVERAGE,
+    'default_slippage': TradingConfig.DEFAULT_SLIPPAGE,
+    'min_margin_required': TradingConfig.MIN_MARGIN_REQUIRED,
+    'gas_limit': TradingConfig.GAS_LIMIT,
+    'execution_fee': f"{MIN_EXECUTION_FEE / 1e18:.6f} ETH",
+    'usdc_decimals': USDC_DECIMALS,
+    'supported_tokens': list(bmx_trader.supported_tokens.keys()) if bmx_trader else [],
+    'live_contracts': {
+        'position_router': BMX_POSITION_ROUTER,
+        'vault': BMX_VAULT_CONTRACT,
+        'bmx_token': BMX_TOKEN_CONTRACT,
+        'wblt_token': WBLT_TOKEN_CONTRACT,
+        'usdc': USDC_CONTRACT
+    },
+    'protocol': 'BMX.trade',
+    'version': 'v300-BMX-KEEPER-LIVE',
+    'network': 'Base (Chain ID: 8453)',
+    'critical_fixes': [
+        '🎯 Keeper-based execution system',
+        '💰 Fixed USDC 6-decimal handling',
+        '🔮 Oracle price validation',
+        '👀 Execution monitoring',
+        '🔧 Enhanced error handling'
+    ],
+    'advantages': [
+        '🎯 No price impact trading',
+        '💪 Reliable keeper execution',
+        '⚡ Up to 50x leverage',
+        '💰 Lower fees',
+        '🚀 Oracle-based pricing'
+    ]
+}
+CONFIG_RESPONSE_BODY = app.json.dumps(CONFIG_PAYLOAD)
 
 @app.route('/config', methods=['GET'])
 def get_config():
     """Get current BMX bot configuration with KEEPER execution info"""
-    return {
-        'position_sizes': TradingConfig.POSITION_SIZES,
-        'tier_percentages': TradingConfig.TIER_POSITION_PERCENTAGES,
-        'default_leverage': TradingConfig.DEFAULT_LEVERAGE,
-        'default_slippage': TradingConfig.DEFAULT_SLIPPAGE,
-        'min_margin_required': TradingConfig.MIN_MARGIN_REQUIRED,
-        'gas_limit': TradingConfig.GAS_LIMIT,
-        'execution_fee': f"{MIN_EXECUTION_FEE / 1e18:.6f} ETH",
-        'usdc_decimals': USDC_DECIMALS,
-        'supported_tokens': list(bmx_trader.supported_tokens.keys()),
-        'live_contracts': {
-            'position_router': BMX_POSITION_ROUTER,
-            'vault': BMX_VAULT_CONTRACT,
-            'bmx_token': BMX_TOKEN_CONTRACT,
-            'wblt_token': WBLT_TOKEN_CONTRACT,
-            'usdc': USDC_CONTRACT
-        },
-        'protocol': 'BMX.trade',
-        'version': 'v300-BMX-KEEPER-LIVE',
-        'network': 'Base (Chain ID: 8453)',
-        'critical_fixes': [
-            '🎯 Keeper-based execution system',
-            '💰 Fixed USDC 6-decimal handling',
-            '🔮 Oracle price validation',
-            '👀 Execution monitoring',
-            '🔧 Enhanced error handling'
-        ],
-        'advantages': [
-            '🎯 No price impact trading',
-            '💪 Reliable keeper execution',
-            '⚡ Up to 50x leverage',
-            '💰 Lower fees',
-            '🚀 Oracle-based pricing'
-        ]
-    }
+    return Response(CONFIG_RESPONSE_BODY, mimetype='application/json')
 
 # ============================================================================
 # 🚀 APPLICATION STARTUP AND MAIN EXECUTION
@@ -1463,11 +1868,11 @@ def initialize_application():
             try:
                 code = web3_manager.w3.eth.get_code(address)
                 if code == '0x':
-                    logger.error(f"❌ {name} contract not found at {address}")
+                    logger.error("❌ %s contract not found at %s", name, address)
                     return False
-                logger.info(f"✅ {name} verified at {address}")
+                logger.info("✅ %s verified at %s", name, address)
             except Exception as e:
-                logger.error(f"❌ Failed to verify {name} contract: {e}")
+                logger.error("❌ Failed to verify %s contract: %s", name, e)
                 return False
 
         # Check Web3 connection
@@ -1480,7 +1885,7 @@ def initialize_application():
             logger.warning("⚠️ No trading account configured (read-only mode)")
         else:
             balance = web3_manager.get_usdc_balance(web3_manager.account.address)
-            logger.info(f"💰 Account balance: ${balance:.6f} USDC (6 decimals)")
+            logger.info("💰 Account balance: $%.6f USDC (6 decimals)", balance)
 
         # Initialize components
         logger.info("✅ Signal processor initialized for BMX keeper execution")
@@ -1488,21 +1893,21 @@ def initialize_application():
         logger.info("✅ Google Sheets manager initialized")
 
         # Log BMX contract addresses
-        logger.info(f"🔧 BMX KEEPER CONTRACT ADDRESSES:")
-        logger.info(f"  - Position Router: {BMX_POSITION_ROUTER}")
-        logger.info(f"  - Vault: {BMX_VAULT_CONTRACT}")
-        logger.info(f"  - BMX Token: {BMX_TOKEN_CONTRACT}")
-        logger.info(f"  - wBLT Token: {WBLT_TOKEN_CONTRACT}")
+        logger.info("🔧 BMX KEEPER CONTRACT ADDRESSES:")
+        logger.info("  - Position Router: %s", BMX_POSITION_ROUTER)
+        logger.info("  - Vault: %s", BMX_VAULT_CONTRACT)
+        logger.info("  - BMX Token: %s", BMX_TOKEN_CONTRACT)
+        logger.info("  - wBLT Token: %s", WBLT_TOKEN_CONTRACT)
 
         # Log configuration
-        logger.info(f"🔧 BMX Keeper Configuration:")
-        logger.info(f"  - Position sizes: {TradingConfig.POSITION_SIZES}")
-        logger.info(f"  - Tier percentages: {TradingConfig.TIER_POSITION_PERCENTAGES}")
-        logger.info(f"  - Default leverage: {TradingConfig.DEFAULT_LEVERAGE}x")
-        logger.info(f"  - Default slippage: {TradingConfig.DEFAULT_SLIPPAGE*100}%")
-        logger.info(f"  - Minimum margin: ${TradingConfig.MIN_MARGIN_REQUIRED}")
-        logger.info(f"  - Execution fee: {MIN_EXECUTION_FEE / 1e18:.6f} ETH")
-        logger.info(f"  - Supported tokens: {len(bmx_trader.supported_tokens)}")
+        logger.info("🔧 BMX Keeper Configuration:")
+        logger.info("  - Position sizes: %s", TradingConfig.POSITION_SIZES)
+        logger.info("  - Tier percentages: %s", TradingConfig.TIER_POSITION_PERCENTAGES)
+        logger.info("  - Default leverage: %sx", TradingConfig.DEFAULT_LEVERAGE)
+        logger.info("  - Default slippage: %s%%", TradingConfig.DEFAULT_SLIPPAGE*100)
+        logger.info("  - Minimum margin: $%s", TradingConfig.MIN_MARGIN_REQUIRED)
+        logger.info("  - Execution fee: %.6f ETH", MIN_EXECUTION_FEE / 1e18)
+        logger.info("  - Supported tokens: %s", len(bmx_trader.supported_tokens))
 
         logger.info("🎯 BMX KEEPER ADVANTAGES:")
         logger.info("  🎯 Keeper-based execution system")
@@ -1517,9 +1922,30 @@ def initialize_application():
         return True
 
     except Exception as e:
-        logger.error(f"❌ BMX application initialization failed: {str(e)}")
+        logger.error("❌ BMX application initialization failed: %s", e)
         return False
 
+def reset_connections():
+    """Give a forked worker its own RPC and price-API connections"""
+    global http_session
+    http_session = requests.Session()
+    if web3_manager:
+        web3_manager.reset_connections()
+
+def warm_up():
+    """Start the trade loop and open an RPC connection for it before the first signal"""
+    try:
+        _get_async_loop()
+        if web3_manager and web3_manager.account:
+            # Trades make their RPC calls from the loop's to_thread workers
+            # (web3 keeps a session per thread) - warm one of those, uncached
+            run_async(asyncio.to_thread(
+                web3_manager.get_usdc_balance, web3_manager.account.address, use_cache=False
+            ), timeout=30)
+        logger.info("🔥 Worker warmed up - async loop running, trade-side RPC connection open")
+    except Exception as e:
+        logger.warning("⚠️ Worker warm-up failed (first trade will connect lazily): %s", e)
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -1527,7 +1953,7 @@ def not_found(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"❌ BMX internal server error: {str(error)}")
+    logger.error("❌ BMX internal server error: %s", error)
     return {'error': 'BMX internal server error'}, 500
 
 # ============================================================================
@@ -1543,7 +1969,7 @@ if __name__ == '__main__':
     # Get port from environment (Heroku compatibility)
     port = int(os.environ.get('PORT', 5000))
 
-    logger.info(f"🌐 Starting BMX Flask server on port {port}...")
+    logger.info("🌐 Starting BMX Flask server on port %s...", port)
 
     # Start the Flask application
     app.run(
@@ -1,11 +1,43 @@
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"  # Heroku-assigned port
+
 timeout = 240          # 4 minutes for blockchain operations
 
 keepalive = 120        # Keep connections alive
 
-max_requests = 1000    # Restart workers periodically
+graceful_timeout = 30  # Heroku sends SIGKILL 30s after SIGTERM
 
 preload_app = True     # Improve performance
 
-workers = 1            # Single worker for consistent state
+workers = 1            # Single worker for consistent state (one trade at a time)
+
+worker_class = 'gthread'  # Threaded worker - /, /balance stay responsive during a trade
+
+threads = int(os.environ.get('GUNICORN_THREADS', 8))  # Concurrent requests per worker
+
+
+def when_ready(server):
+    # Same startup verification as `python bmx_trading_module.py` - refuse to
+    # boot a dyno that can't reach the chain or the BMX contracts
+    from bmx_trading_module import initialize_application
+    if not initialize_application():
+        server.halt(reason="BMX application initialization failed", exit_status=1)
+
+
+def post_fork(server, worker):
+    # preload_app opened RPC/price connections in the master (import and
+    # when_ready) - replace them, then warm the worker so the first trade
+    # doesn't pay for the event loop start-up and the RPC TLS handshake
+    from bmx_trading_module import reset_connections, warm_up
+    reset_connections()
+    warm_up()
+
 
-worker_class = 'sync'  # Synchronous worker
+def worker_exit(server, worker):
+    # Queued trades run on a daemon thread gunicorn doesn't wait for - give an
+    # in-flight sub-account/approve/deposit sequence time to finish on shutdown.
+    # Receipt waits are capped (TradingConfig.RECEIPT_TIMEOUT) so a trade fits
+    # this window; one still running when the master SIGKILLs is abandoned
+    from bmx_trading_module import wait_for_pending_trades
+    wait_for_pending_trades(server.cfg.graceful_timeout)
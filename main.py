@@ -1,16 +1,14 @@
-
 #!/usr/bin/env python3
 """
 Heroku entry point for Elite Trading Bot
-Imports the main Flask app from runner.py
+Imports the main Flask app from bmx_trading_module.py
 """
 
-from runner import app
+from bmx_trading_module import app
 
 if __name__ == '__main__':
-    # This ensures the app runs correctly when called directly
-    # but Heroku will use gunicorn main:app
+    # Local development only - Heroku serves main:app via gunicorn (see Procfile)
     import os
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
     # trigger redeploy
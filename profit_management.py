@@ -1,11 +1,18 @@
 import smtplib
 import os
-import json
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
 
+# Profit split per phase - shared, read-only tables built once at import
+ALLOCATION_PHASES = MappingProxyType({
+    "growth_focus": MappingProxyType({"reinvest": 0.80, "btc_stack": 0.15, "reserve": 0.05}),
+    "balanced_growth": MappingProxyType({"reinvest": 0.70, "btc_stack": 0.20, "reserve": 0.10}),
+    "wealth_protection": MappingProxyType({"reinvest": 0.60, "btc_stack": 0.20, "reserve": 0.20})
+})
+
 class EnhancedProfitManager:
     def __init__(self):
         self.notification_email = os.getenv('NOTIFICATION_EMAIL')
@@ -14,12 +21,9 @@ class EnhancedProfitManager:
         self.btc_wallet = os.getenv('BTC_WALLET_ADDRESS')
         self.system_start_date = self._get_system_start_date()
         self.performance_history = []
-
-        self.allocation_phases = {
-            "growth_focus": {"reinvest": 0.80, "btc_stack": 0.15, "reserve": 0.05},
-            "balanced_growth": {"reinvest": 0.70, "btc_stack": 0.20, "reserve": 0.10},
-            "wealth_protection": {"reinvest": 0.60, "btc_stack": 0.20, "reserve": 0.20}
-        }
+        self._months_cache = (None, 0)  # (valid until, months running)
+        self._allocation_cache = {}  # (months running, large account) -> allocation
+        self.allocation_phases = ALLOCATION_PHASES
 
     def _get_system_start_date(self):
         try:
@@ -32,11 +36,18 @@ class EnhancedProfitManager:
             return datetime.now()
 
     def get_months_running(self):
-        delta = datetime.now() - self.system_start_date
-        return delta.days // 30
-
-    def get_current_phase(self, account_balance):
-        months = self.get_months_running()
+        # Only changes once a day - recompute when the next day of uptime starts
+        now = datetime.now()
+        valid_until, months = self._months_cache
+        if valid_until is None or now >= valid_until:
+            days = (now - self.system_start_date).days
+            months = days // 30
+            self._months_cache = (self.system_start_date + timedelta(days=days + 1), months)
+        return months
+
+    def get_current_phase(self, account_balance, months=None):
+        if months is None:
+            months = self.get_months_running()
         if months <= 6:
             return "growth_focus", "Phase 1: Aggressive Growth"
         elif months <= 12:
@@ -45,17 +56,27 @@ class EnhancedProfitManager:
             return "wealth_protection", "Phase 3: Wealth Protection"
 
     def get_dynamic_allocation(self, account_balance):
-        phase_key, phase_name = self.get_current_phase(account_balance)
-        allocation = self.allocation_phases[phase_key].copy()
-        if account_balance > 50000:
+        # Only the months running and the >$50k tier change the result, so
+        # it is built once per combination; callers get a copy they may modify
+        months = self.get_months_running()
+        cache_key = (months, account_balance > 50000)
+        cached = self._allocation_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        phase_key, phase_name = self.get_current_phase(account_balance, months)
+        allocation = dict(self.allocation_phases[phase_key])
+        if cache_key[1]:
             allocation["reinvest"] -= 0.05
             allocation["reserve"] += 0.05
-        return {
+        result = {
             **allocation,
             "phase": phase_name,
             "phase_key": phase_key,
-            "months_running": self.get_months_running()
+            "months_running": months
         }
+        self._allocation_cache[cache_key] = result
+        return dict(result)
 
     def process_enhanced_profit(self, profit_amount, account_balance, trade_data=None):
         try:
@@ -148,11 +169,12 @@ class EnhancedProfitManager:
         return abs(loss_amount) >= 10
 
     def get_performance_summary(self):
+        now = datetime.now()
         return {
-            "system_age_days": (datetime.now() - self.system_start_date).days,
+            "system_age_days": (now - self.system_start_date).days,
             "current_phase": self.get_current_phase(1500)[1],
             "total_trades": len(self.performance_history),
             "total_btc_accumulated": self._get_cumulative_btc(),
             "total_reserve_accumulated": self._get_cumulative_reserve(),
-            "last_updated": datetime.now().isoformat()
+            "last_updated": now.isoformat()
         }